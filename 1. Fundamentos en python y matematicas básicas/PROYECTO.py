@@ -1,54 +1,117 @@
 # SISTEMA DE GESTION ESCOLAR
 
+import hashlib
+import io
 import json
 import csv
+import math
 import os
+import re
+import threading
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
+
+try:
+    import orjson  # serializador/parser JSON mucho más rápido que el stdlib
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # para promediar todo el alumnado en una sola pasada C
+except ImportError:
+    np = None
 
 DATA_JSON = "alumnos.json"
 DATA_CSV = "alumnos.csv"
 
+# Encoders creados una sola vez para no reconstruirlos en cada guardado.
+# El compacto omite los espacios tras ',' y ':' (menos bytes escritos) y
+# iterencode emite por trozos sin armar el string completo del registro
+_enc_compacto = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).iterencode
+_enc_legible = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
+# Localiza el campo "dni" dentro de una línea-registro sin parsear todo
+_RE_DNI = re.compile(rb'"dni"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+# Filtro de Bloom para DNIs: 2^20 bits (128 KB) y 5 posiciones por DNI
+# dan <1% de falsos positivos hasta ~100k registros
+_BLOOM_BITS = 1 << 20
+_BLOOM_K = 5
+
+
+def _bloom_posiciones(dni: str) -> list[int]:
+    """Deriva las posiciones de bits de un DNI por doble hashing."""
+    d = hashlib.blake2b(dni.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(d[:8], "little")
+    h2 = int.from_bytes(d[8:], "little") | 1
+    return [(h1 + i * h2) % _BLOOM_BITS for i in range(_BLOOM_K)]
+
 
 # Tupla para cursos fijos
 CURSOS_DISPONIBLES = (
     "Matemática",
     "Lenguaje",
     "Ciencia"
-) 
+)
+
+# frozenset para consultas de pertenencia O(1); la tupla conserva el orden
+_CURSOS_SET = frozenset(CURSOS_DISPONIBLES)
 
-def leer_float(mensaje: str, minimo: float = None, maximo: float = None):
-    """Lee un número float con validación opcional de rango"""
+# índice fijo de cada curso dentro del array de notas de un Alumno
+_CURSO_IDX = {c: i for i, c in enumerate(CURSOS_DISPONIBLES)}
+_NAN = float("nan")
+
+def leer_float(mensaje: str, minimo: float = None, maximo: float = None,
+               _input=input, _float=float, _print=print):
+    """Lee un número float con validación opcional de rango
+    (los builtins vienen pre-ligados como locales para ahorrar el
+    LOAD_GLOBAL en cada vuelta del bucle)"""
     while True:
         try:
-            val = float(input(mensaje))
+            val = _float(_input(mensaje))
             if minimo is not None and val < minimo:
-                print(f"* Debe ser >= {minimo}")
+                _print(f"* Debe ser >= {minimo}")
                 continue
             if maximo is not None and val > maximo:
-                print(f"* Debe ser <= {maximo}")
+                _print(f"* Debe ser <= {maximo}")
                 continue
             return val
         except ValueError:
-            print("* Ingrese un número válido")
-            
-def leer_int(mensaje: str, minimo: int = None, maximo: int = None):
+            _print("* Ingrese un número válido")
+
+def leer_int(mensaje: str, minimo: int = None, maximo: int = None,
+             _input=input, _int=int, _print=print):
     """Lee un entero con validación opcional de rango."""
     while True:
         try:
-            val = int(input(mensaje))
+            val = _int(_input(mensaje))
             if minimo is not None and val<minimo:
-                print(f"* Debe ser >= {minimo}")
+                _print(f"* Debe ser >= {minimo}")
                 continue
             if maximo is not None and val>maximo:
-                print(f"* Debe ser <= {maximo}")
+                _print(f"* Debe ser <= {maximo}")
                 continue
             return val
         except ValueError:
-            print("* Ingrese un número entero válido")
+            _print("* Ingrese un número entero válido")
+
+def leer_texto(mensaje: str, _input=input) -> str:
+    """Lee una línea y la limpia solo si hace falta: strip() siempre
+    aloca un string nuevo, incluso cuando no hay nada que recortar."""
+    s = _input(mensaje)
+    if s and (s[0].isspace() or s[-1].isspace()):
+        s = s.strip()
+    return s
 
 def pausar():
     input("\nPresiona ENTER para continuar...")
             
 class Persona:
+    # __slots__ elimina el __dict__ por instancia: menos memoria y
+    # acceso a atributos más directo ("__dni" se mangla a _Persona__dni)
+    __slots__ = ("nombre", "edad", "__dni")
+
     def __init__(self, nombre: str, edad: int, dni: str):
         self.nombre = nombre
         self.edad = edad
@@ -62,28 +125,56 @@ class Persona:
         return f"{self.nombre} (Edad: {self.edad} , DNI: {self.__dni})"
 
 class Alumno(Persona):
+    __slots__ = ("notas", "_suma_notas", "_num_notas", "_nombre_lower")
+
     def __init__(self, nombre: str, edad: int, dni: str):
         super().__init__(nombre, edad, dni)
-        self.notas: dict[str, float] = {}
-        
+        # clave de orden en minúsculas cacheada: el sort del listado no
+        # vuelve a alocar nombre.lower() por cada comparación
+        self._nombre_lower = nombre.lower()
+        # array compacto indexado por curso (NaN = sin nota): sin hash
+        # de strings por acceso y con los floats contiguos en memoria
+        self.notas: array = array("d", [_NAN] * len(CURSOS_DISPONIBLES))
+        # suma y cuenta incrementales: promedio() queda en O(1) sin
+        # recorrer las notas ni invalidar ningún cache
+        self._suma_notas: float = 0.0
+        self._num_notas: int = 0
+
     def set_nota(self, curso: str, nota: float):
-        self.notas[curso] = nota
-        
+        idx = _CURSO_IDX[curso]
+        anterior = self.notas[idx]
+        if anterior == anterior:  # no es NaN: había nota previa
+            self._suma_notas -= anterior
+        else:
+            self._num_notas += 1
+        self._suma_notas += nota
+        self.notas[idx] = nota
+
+    @property
+    def notas_dict(self) -> dict[str, float]:
+        """Vista {curso: nota} para la UI y la capa JSON."""
+        return {CURSOS_DISPONIBLES[i]: n
+                for i, n in enumerate(self.notas) if not math.isnan(n)}
+
     def promedio(self) -> float:
-        if not self.notas:
+        if not self._num_notas:
             return 0.0
-        return sum(self.notas.values())/len(self.notas)
+        return self._suma_notas / self._num_notas
 
     def aprobado(self) -> bool:
         return self.promedio() >= 11.0
-    
-    def info(self) -> str: #polimorfismo: sobreescribimos   
+
+    def info(self, prom: float | None = None) -> str: #polimorfismo: sobreescribimos
+        # `prom` permite pasar un promedio ya calculado en lote
         base = super().info()
-        prom = self.promedio()
-        estado = "APROBADO" if self.aprobado() else "DESAPROBADO"
+        if prom is None:
+            prom = self.promedio()
+        estado = "APROBADO" if prom >= 11.0 else "DESAPROBADO"
         return f"{base} | Promedio: {prom:.2f} -> {estado}"
         
 class Profesor(Persona):
+    __slots__ = ("cursos_asignados",)
+
     def __init__(self, nombre: str, edad: int, dni: str, cursos_asignados: tuple[str,...] = CURSOS_DISPONIBLES):
         super().__init__(nombre, edad, dni)
         self.cursos_asignados = cursos_asignados
@@ -93,32 +184,124 @@ class Profesor(Persona):
         cursos = ", ".join(self.cursos_asignados)
         return f"{base} | Profesor de: {cursos}"
 
+def _iter_registros_json(f):
+    """
+    Itera los registros de un JSON de un-registro-por-línea parseando
+    de a uno: la memoria pico es la de un solo registro, no la del
+    archivo. Si el archivo no tiene ese formato (p. ej. guardado con
+    pretty=True) recurre al parseo completo del buffer.
+    """
+    parse = orjson.loads if orjson is not None else json.loads
+    produjo = False
+    cerrado = False
+    for linea in f:
+        registro = linea.strip().rstrip(b",")
+        if registro == b"]":
+            cerrado = True
+            continue
+        if registro in (b"", b"["):
+            continue
+        if registro.startswith(b"{") and registro.endswith(b"}"):
+            yield parse(registro)
+            produjo = True
+            continue
+        if produjo:
+            raise ValueError("registro irreconocible en formato lineal")
+        # formato no lineal: se reparsea el archivo entero
+        f.seek(0)
+        yield from parse(f.read())
+        return
+    # sin el ']' final el archivo está truncado (p. ej. un guardado
+    # interrumpido): mejor rechazarlo que cargar un roster parcial
+    if not cerrado:
+        raise ValueError("archivo truncado: falta el ']' de cierre")
+
+
+def _alumno_desde_registro(item: dict) -> Alumno:
+    """Reconstruye un Alumno desde un dict leído del JSON."""
+    a = Alumno(item["nombre"], int(item["edad"]), item["dni"])
+    # validar que las notas sean floats y el curso conocido; set_nota
+    # mantiene la suma incremental del promedio al día
+    for curso, n in item.get("notas", {}).items():
+        try:
+            a.set_nota(curso, float(n))
+        except (TypeError, ValueError, KeyError):
+            pass
+    return a
+
+
 class Escuela:
     def __init__(self):
-        self.alumnos: dict[str, Alumno] = {}
-        self._dni_registrados : set[str] = set()
-        
+        # el propio dict de alumnos (clave = DNI) ya da la búsqueda O(1);
+        # no hace falta un set paralelo de DNIs. Un valor None es un
+        # centinela: el registro está indexado en disco pero aún no se
+        # materializó como objeto (ver cargar_indice_json)
+        self.alumnos: dict[str, Alumno | None] = {}
+        self._indice_offsets: dict[str, tuple[int, int]] = {}
+        self._indice_ruta: str | None = None
+        # pool para guardar JSON/CSV en segundo plano sin bloquear el menú
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._io_futuros: list[Future] = []
+        self._io_locks: dict[str, threading.Lock] = {}
+        # filtro de Bloom delante del dict: si algún bit está en 0 el
+        # DNI es nuevo con certeza y se ahorra la consulta al dict
+        self._dni_bloom = bytearray(_BLOOM_BITS // 8)
+
+    def _bloom_quiza_existe(self, posiciones: list[int]) -> bool:
+        bloom = self._dni_bloom
+        return all(bloom[p >> 3] & (1 << (p & 7)) for p in posiciones)
+
+    def _bloom_marcar(self, posiciones: list[int]) -> None:
+        bloom = self._dni_bloom
+        for p in posiciones:
+            bloom[p >> 3] |= 1 << (p & 7)
+
     # CRUD Alumnos
     def registrar_alumno(self, nombre: str, edad: int, dni: str) -> bool:
-        if dni in self._dni_registrados:
+        posiciones = _bloom_posiciones(dni)
+        # el dict solo se consulta si el filtro dice "quizás existe";
+        # tras un eliminar_alumno los bits quedan (falso positivo), por
+        # eso el dict sigue siendo la verdad definitiva
+        if self._bloom_quiza_existe(posiciones) and dni in self.alumnos:
             return False
-        alumno = Alumno(nombre, edad, dni)
-        self.alumnos[dni] = alumno
-        self._dni_registrados.add(dni)
+        self._bloom_marcar(posiciones)
+        self.alumnos[dni] = Alumno(nombre, edad, dni)
         return True
-    
+
     def eliminar_alumno(self, dni: str) -> bool:
-        if dni not in self._dni_registrados:
-            return False
-        self._dni_registrados.remove(dni)
+        existia = dni in self.alumnos
         self.alumnos.pop(dni, None)
-        return True
-    
+        self._indice_offsets.pop(dni, None)
+        return existia
+
     def obtener_alumno(self, dni: str) -> Alumno | None:
-        return self.alumnos.get(dni)
-    
+        a = self.alumnos.get(dni)
+        if a is None and dni in self._indice_offsets:
+            a = self._cargar_alumno(dni)
+        return a
+
     def listar_alumnos(self) -> list[Alumno]:
-        return list(self.alumnos.values())    
+        self._cargar_pendientes()
+        return list(self.alumnos.values())
+
+    def promedios_batch(self) -> dict[str, float]:
+        """
+        Calcula el promedio de todos los alumnos de una sola vez.
+        Con NumPy arma una matriz (N, cursos) con NaN en los cursos sin
+        nota y reduce por filas en una llamada C; sin NumPy cae al
+        promedio() por alumno.
+        """
+        self._cargar_pendientes()
+        alumnos = list(self.alumnos.values())
+        if np is None or not alumnos:
+            return {a.dni: a.promedio() for a in alumnos}
+        # los arrays de notas ya son filas numéricas con NaN en los
+        # cursos sin nota: se apilan directo, sin armar dicts intermedios
+        arr = np.array([a.notas for a in alumnos])
+        cuenta = np.count_nonzero(~np.isnan(arr), axis=1)
+        sumas = np.nansum(arr, axis=1)
+        proms = np.where(cuenta > 0, sumas / np.maximum(cuenta, 1), 0.0)
+        return {a.dni: float(p) for a, p in zip(alumnos, proms)}
     
     # Notas
     
@@ -126,66 +309,239 @@ class Escuela:
         alumno = self.obtener_alumno(dni)
         if not alumno:
             return False
-        if curso not in CURSOS_DISPONIBLES:
+        if curso not in _CURSOS_SET:
             return False
         alumno.set_nota(curso, nota)
         return True
     
     # Persistencia (JSON & CSV)
-    def guardar_json(self, ruta:str = DATA_JSON) -> None:
-        data = []
-        for a in self.alumnos.values():
-            data.append({
-                "nombre": a.nombre,
-                "edad": a.edad,
-                "dni": a.dni,
-                "notas": a.notas 
-            })
-        with open(ruta, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _lock_de(self, ruta: str) -> threading.Lock:
+        # un lock por archivo serializa escrituras concurrentes al mismo path
+        return self._io_locks.setdefault(ruta, threading.Lock())
+
+    def guardar_json(self, ruta:str = DATA_JSON, pretty: bool = False) -> None:
+        self._cargar_pendientes()
+        self._escribir_json(ruta, list(self.alumnos.values()), pretty)
+
+    def guardar_json_async(self, ruta:str = DATA_JSON) -> Future:
+        """Encola el guardado en el pool de I/O y devuelve el Future.
+        El snapshot se toma en el hilo principal para no iterar el dict
+        mientras otro hilo lo muta."""
+        self._cargar_pendientes()
+        fut = self._io_pool.submit(self._escribir_json, ruta, list(self.alumnos.values()))
+        self._io_futuros.append(fut)
+        return fut
+
+    def _escribir_json(self, ruta: str, alumnos: list[Alumno],
+                       pretty: bool = False) -> None:
+        # Escribe un registro por línea en vez de armar la lista completa
+        # en memoria antes de volcarla: el consumo extra queda en O(1).
+        # Por defecto emite JSON compacto; pretty=True indenta a costa
+        # de perder el formato indexable de un registro por línea
+        with self._lock_de(ruta), open(ruta, "wb") as f:
+            f.write(b"[\n")
+            primero = True
+            for a in alumnos:
+                registro = {
+                    "nombre": a.nombre,
+                    "edad": a.edad,
+                    "dni": a.dni,
+                    "notas": a.notas_dict
+                }
+                if not primero:
+                    f.write(b",\n")
+                primero = False
+                if orjson is not None:
+                    opcion = orjson.OPT_NON_STR_KEYS
+                    if pretty:
+                        opcion |= orjson.OPT_INDENT_2
+                    f.write(orjson.dumps(registro, option=opcion))
+                elif pretty:
+                    f.write(_enc_legible(registro).encode("utf-8"))
+                else:
+                    for trozo in _enc_compacto(registro):
+                        f.write(trozo.encode("utf-8"))
+            f.write(b"\n]\n")
     
     def cargar_json(self, ruta:str = DATA_JSON) -> None:
         if not os.path.exists(ruta):
             return
-        with open(ruta, "r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                print("* Archivo JSON corrupto o vvacio. Se ignorará la carga.")
-                return
-            
-        # Reconstruccion de objetos
-        self.alumnos.clear()
-        self._dni_registrados.clear()
-        for item in data: 
-            a = Alumno(item["nombre"], int(item["edad"]), item["dni"])
-            # valudar que las notas sean floats
-            notas_limpias = {}
-            for curso, n in item.get("notas", {}).items():
-                try:
-                    notas_limpias[curso] = float(n)
-                except (TypeError, ValueError):
-                    pass
-            a.notas = notas_limpias
-            self.alumnos[a.dni] = a
-            self._dni_registrados.add(a.dni)
-            
-    
+        # Reconstruccion de objetos registro a registro: solo un item
+        # parseado vive en memoria a la vez (salvo formato no lineal)
+        nuevos: dict[str, Alumno] = {}
+        bloom = bytearray(_BLOOM_BITS // 8)
+        try:
+            # el lock del path también protege la lectura: sin él se
+            # leería el archivo a medio escribir por un guardado en
+            # segundo plano
+            with self._lock_de(ruta), open(ruta, "rb") as f:
+                for item in _iter_registros_json(f):
+                    a = _alumno_desde_registro(item)
+                    nuevos[a.dni] = a
+                    for p in _bloom_posiciones(a.dni):
+                        bloom[p >> 3] |= 1 << (p & 7)
+        except ValueError:
+            print("* Archivo JSON corrupto o vvacio. Se ignorará la carga.")
+            return
+        # swap atómico: ni re-hash sobre la tabla vieja ni estado a
+        # medias si algo falló antes de llegar acá
+        self.alumnos = nuevos
+        self._indice_offsets.clear()
+        self._dni_bloom = bloom
+
+    def cargar_indice_json(self, ruta:str = DATA_JSON) -> None:
+        """
+        Carga perezosa para el arranque: recorre el archivo una vez
+        anotando en qué byte empieza cada registro (formato de un
+        registro por línea) y deja centinelas None en self.alumnos.
+        Los objetos Alumno se construyen recién cuando alguien los pide.
+        """
+        if not os.path.exists(ruta):
+            return
+        offsets: dict[str, tuple[int, int]] = {}
+        offset = 0
+        lineal = True
+        cerrado = False
+        # mismo lock que los escritores: no indexar un archivo que un
+        # guardado en segundo plano todavía está escribiendo. La carga
+        # completa de respaldo se hace fuera del with (el lock del path
+        # no es reentrante)
+        with self._lock_de(ruta), open(ruta, "rb") as f:
+            for linea in f:
+                m = _RE_DNI.search(linea)
+                if m is not None:
+                    registro = linea.strip().rstrip(b",")
+                    if not (registro.startswith(b"{") and registro.endswith(b"}")):
+                        # formato antiguo (registro en varias líneas):
+                        # no es indexable línea a línea, carga completa
+                        lineal = False
+                        break
+                    offsets[json.loads(m.group(1))] = (offset, len(linea))
+                elif linea.strip() == b"]":
+                    cerrado = True
+                offset += len(linea)
+        if not lineal:
+            self.cargar_json(ruta)
+            return
+        if not cerrado:
+            # archivo truncado (guardado interrumpido): no indexar un
+            # roster parcial
+            print("* Archivo JSON corrupto o vvacio. Se ignorará la carga.")
+            return
+        # dict.fromkeys dimensiona la tabla de una vez y deja los
+        # centinelas None sin insertar clave por clave
+        self.alumnos = dict.fromkeys(offsets)
+        self._indice_offsets = offsets
+        self._indice_ruta = ruta
+        self._dni_bloom = bytearray(_BLOOM_BITS // 8)
+        for dni in offsets:
+            self._bloom_marcar(_bloom_posiciones(dni))
+
+    def _cargar_alumno(self, dni: str) -> Alumno:
+        """Materializa un único alumno pendiente leyendo su registro."""
+        offset, largo = self._indice_offsets.pop(dni)
+        with open(self._indice_ruta, "rb") as f:
+            f.seek(offset)
+            registro = f.read(largo).strip().rstrip(b",")
+        item = orjson.loads(registro) if orjson is not None else json.loads(registro)
+        a = _alumno_desde_registro(item)
+        self.alumnos[dni] = a
+        return a
+
+    def _cargar_pendientes(self) -> None:
+        """Materializa todos los alumnos aún indexados en disco."""
+        if not self._indice_offsets or self._indice_ruta is None:
+            return
+        with open(self._indice_ruta, "rb") as f:
+            for dni, (offset, largo) in self._indice_offsets.items():
+                if self.alumnos.get(dni) is not None:
+                    continue
+                f.seek(offset)
+                registro = f.read(largo).strip().rstrip(b",")
+                item = orjson.loads(registro) if orjson is not None else json.loads(registro)
+                self.alumnos[dni] = _alumno_desde_registro(item)
+        self._indice_offsets.clear()
+
+
     def exportar_csv(self, ruta: str = DATA_CSV) -> None:
+        self._cargar_pendientes()
+        self._escribir_csv(ruta, list(self.alumnos.values()), self.promedios_batch())
+
+    def exportar_csv_async(self, ruta: str = DATA_CSV) -> Future:
+        """Encola la exportación CSV en el pool de I/O."""
+        self._cargar_pendientes()
+        fut = self._io_pool.submit(
+            self._escribir_csv, ruta, list(self.alumnos.values()), self.promedios_batch())
+        self._io_futuros.append(fut)
+        return fut
+
+    def _escribir_csv(self, ruta: str, alumnos: list[Alumno],
+                      promedios: dict[str, float]) -> None:
         """
         Exporta a CSV con columnas: DNI, Nombre, Edad, Curso, Nota, Promedio
+        Si ningún campo necesita comillas arma las líneas con f-strings y
+        las vuelca en lotes (mucho más barato que csv.writer); si algún
+        nombre/DNI trae coma, comilla o salto de línea cae al csv.writer
+        para mantener el escape correcto.
         """
-        
-        with open(ruta, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["DNI", "Nombre", "Edad", "Curso", "Nota", "Promedio"])
-            for a in self.alumnos.values():
-                prom = f"{a.promedio():.2f}"
-                if a.notas:
-                    for curso, nota in a.notas.items():
-                        writer.writerow(a.dni, a.nombre, a.edad, curso, nota, prom)
+
+        necesita_escape = any(
+            "," in c or '"' in c or "\n" in c or "\r" in c
+            for a in alumnos for c in (a.dni, a.nombre))
+        with self._lock_de(ruta), \
+                open(ruta, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            if necesita_escape:
+                # el writer serializa a un StringIO en memoria y el
+                # archivo recibe volcados grandes (cada ~10 MB y uno
+                # final): menos cruces Python->C y menos syscalls
+                buf = io.StringIO()
+                writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(["DNI", "Nombre", "Edad", "Curso", "Nota", "Promedio"])
+                rows = []
+                for a in alumnos:
+                    prom = f"{promedios[a.dni]:.2f}"
+                    notas = a.notas_dict
+                    if notas:
+                        for curso, nota in notas.items():
+                            rows.append((a.dni, a.nombre, a.edad, curso, nota, prom))
+                    else:
+                        rows.append((a.dni, a.nombre, a.edad, "", "", prom))
+                    if len(rows) >= 1000:
+                        writer.writerows(rows)
+                        rows.clear()
+                        if buf.tell() > 10_000_000:
+                            f.write(buf.getvalue())
+                            buf.seek(0)
+                            buf.truncate()
+                if rows:
+                    writer.writerows(rows)
+                f.write(buf.getvalue())
+                return
+
+            f.write("DNI,Nombre,Edad,Curso,Nota,Promedio\r\n")
+            lote = []
+            for a in alumnos:
+                prom = f"{promedios[a.dni]:.2f}"
+                notas = a.notas_dict
+                if notas:
+                    for curso, nota in notas.items():
+                        lote.append(f"{a.dni},{a.nombre},{a.edad},{curso},{nota},{prom}\r\n")
                 else:
-                    writer.writerow([a.dni, a.nombre, a.edad, "", "", prom])
+                    lote.append(f"{a.dni},{a.nombre},{a.edad},,,{prom}\r\n")
+                if len(lote) >= 1000:
+                    f.write("".join(lote))
+                    lote.clear()
+            if lote:
+                f.write("".join(lote))
+
+    def esperar_io(self) -> None:
+        """Barrera: espera los guardados en segundo plano pendientes."""
+        for fut in self._io_futuros:
+            try:
+                fut.result()
+            except Exception as exc:
+                print(f"* Error en un guardado en segundo plano: {exc}")
+        self._io_futuros.clear()
 
 # UI consola
 
@@ -208,9 +564,9 @@ def menu():
     
 def registrar_alumno_ui(escuela: Escuela):
     print("\n--- Registrar alumno ---")
-    nombre = input("Nombre: ").strip()
+    nombre = leer_texto("Nombre: ")
     edad = leer_int("Edad: ", minimo=0, maximo=120)
-    dni = input("DNI: ").strip()
+    dni = leer_texto("DNI: ")
     if escuela.registrar_alumno(nombre,edad,dni):
         print("Alumno registrado")
     else:
@@ -218,7 +574,7 @@ def registrar_alumno_ui(escuela: Escuela):
         
 def asignar_notas_ui(escuela: Escuela):
     print("\n--- Asignar notas ---")
-    dni = input("DNI del alumno: ".strip())
+    dni = leer_texto("DNI del alumno: ")
     alumno = escuela.obtener_alumno(dni)
     if not alumno:
         print("No existe un alumno con ese dni")
@@ -226,7 +582,7 @@ def asignar_notas_ui(escuela: Escuela):
     mostrar_cursos()
     print("Ingrese notas de 0 al 20 (deje vacio para omitir un curso)")
     for curso in CURSOS_DISPONIBLES:
-        entrada = input(f"Nota de {curso}: ").strip()
+        entrada = leer_texto(f"Nota de {curso}: ")
         if entrada == "":
             continue
         try:
@@ -241,15 +597,16 @@ def asignar_notas_ui(escuela: Escuela):
     
 def info_alumno_ui(escuela:Escuela):
     print("\n--- Informacion de alumno ---")
-    dni = input("DNI del alumno: ").strip()
+    dni = leer_texto("DNI del alumno: ")
     a = escuela.obtener_alumno(dni)
     if not a:
         print("No existe un alumno con ese DNI")
         return
     print("\n"+ a.info())
-    if a.notas:
+    notas = a.notas_dict
+    if notas:
         print("Notas:")
-        for c,n in a.notas.items():
+        for c,n in notas.items():
             print(f" - {c}: {n}")
     else:
         print("Sin notas registradas")
@@ -260,40 +617,43 @@ def listar_alumnos_ui(escuela:Escuela):
     if not alumnos:
         print("No hay alumnos registrados")
         return
-    alumnos.sort(key=lambda x: x.nombre.lower())
+    # attrgetter corre en C y lee la clave ya cacheada en el alumno
+    alumnos.sort(key=attrgetter("_nombre_lower"))
+    promedios = escuela.promedios_batch()
     for a in alumnos:
-        print(a.info())
+        print(a.info(promedios[a.dni]))
         
 def eliminar_alumno_ui(escuela:Escuela):
     print("\n--- Eliminar alumno ---")
-    dni = input("DNI del alumno: ").strip()
+    dni = leer_texto("DNI del alumno: ")
     if escuela.eliminar_alumno(dni):
         print("Alumno eliminado.")
     else:
         print("No existe un alumno con ese DNI.")
         
 def guardar_ui(escuela:Escuela):
-    escuela.guardar_json(DATA_JSON)
-    print(f"Datos guardados en {DATA_JSON}")
+    escuela.guardar_json_async(DATA_JSON)
+    print(f"Guardado en cola: {DATA_JSON} se escribe en segundo plano")
     
 def cargar_ui(escuela:Escuela):
     escuela.cargar_json(DATA_JSON)
     print(f"Carga finalizada desde {DATA_JSON} (si existía)")
     
 def exportar_csv_ui(escuela:Escuela):
-    escuela.exportar_csv(DATA_CSV)
-    print(f"Datos exportados a {DATA_JSON}")
+    escuela.exportar_csv_async(DATA_CSV)
+    print(f"Exportación en cola: {DATA_CSV} se escribe en segundo plano")
     
 
 def main():
     escuela = Escuela()
     if os.path.exists(DATA_JSON):
-        escuela.cargar_json(DATA_JSON)
+        # solo se indexan los registros; cada alumno se carga al usarse
+        escuela.cargar_indice_json(DATA_JSON)
         print(" i Datos previos cargados automáticamente")
     
     while True:
         menu()
-        op = input("Seleccione una opción: ").strip()
+        op = leer_texto("Seleccione una opción: ")
         if op == "1":
             registrar_alumno_ui(escuela)
             pausar()
@@ -319,6 +679,7 @@ def main():
             exportar_csv_ui(escuela)
             pausar()
         elif op == "9":
+            escuela.esperar_io()  # no salir con escrituras a medias
             print("¡Hasta luego!")
             break
         else: